@@ -1,18 +1,41 @@
+import argparse
 import asyncio
+import aiofiles
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
-from crawl4ai.extraction_strategy import JsonCssExtractionStrategy
+from crawl4ai.extraction_strategy import JsonLxmlExtractionStrategy
 import json
 
+try:
+    import orjson  # Rust-backed JSON, noticeably faster on large result sets
+except ImportError:
+    orjson = None
+
+import hashlib
 import os
+import time
+import weakref
 from pathlib import Path
+from urllib.parse import quote_plus, urlparse
 
-# Create a persistent user data directory
+# Persistent user data directory, created on first run by ensure_profile_dir()
 user_data_dir = os.path.join(Path.home(), ".crawl4ai", "linkedin_profile")
-os.makedirs(user_data_dir, exist_ok=True)
 
-# Configure browser settings with persistent profile
-browser_config = BrowserConfig(
-    headless=False,  # Keep False for initial login
+def ensure_profile_dir():
+    """Create the persistent profile directory if needed; returns True if it was just created"""
+    if os.path.isdir(user_data_dir):
+        return False
+    os.makedirs(user_data_dir, exist_ok=True)
+    return True
+
+def profile_has_cookies():
+    """Check whether Chromium has written a cookie store into the profile yet"""
+    return any(
+        os.path.isfile(os.path.join(user_data_dir, "Default", *parts))
+        for parts in (("Network", "Cookies"), ("Cookies",))
+    )
+
+# Browser settings shared by the login and scrape phases (same persistent profile)
+common_browser_settings = dict(
     verbose=True,
     viewport_width=1920,
     viewport_height=1080,
@@ -21,116 +44,370 @@ browser_config = BrowserConfig(
         "Accept-Language": "en-US,en;q=0.9",
     },
     user_data_dir=user_data_dir,  # Add persistent profile directory
-    use_persistent_context=True    # Enable persistent context
+    use_persistent_context=True,   # Enable persistent context
+    ignore_https_errors=True
+)
+
+# Visible browser for the interactive login
+login_browser_config = BrowserConfig(headless=False, **common_browser_settings)
+
+# Headless browser for scraping; skips the compositor and window-server overhead
+scrape_browser_config = BrowserConfig(
+    headless=True,
+    extra_args=[
+        "--disable-gpu",
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-extensions",
+        # Skip image decoding entirely; the schema only reads text and hrefs
+        "--blink-settings=imagesEnabled=false",
+        "--disable-background-networking",
+        "--disable-renderer-backgrounding",
+        "--disable-background-timer-throttling",
+        "--disable-features=IsolateOrigins,site-per-process",
+    ],
+    **common_browser_settings
+)
+
+# With a persistent profile crawl4ai drives the profile's existing tab rather than a fresh
+# page per arun, and older releases close that tab after any arun without a session_id.
+# Scrape-browser calls therefore share one named session and run one at a time.
+SCRAPE_SESSION_ID = "linkedin_scrape"
+
+# The login tab is kept in its own session so it stays open until the user confirms sign-in
+LOGIN_SESSION_ID = "linkedin_login"
+
+# Resource types and tracking hosts the scraper never needs; the schema only reads DOM text/attributes
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+BLOCKED_HOSTS = (
+    "px.ads.linkedin.com",
+    "snap.licdn.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "bat.bing.com",
 )
 
-async def scrape_linkedin_jobs(search_query, location=""):
-    # Define the schema for job data extraction
-    schema = {
-        "name": "LinkedIn Jobs",
-        "baseSelector": ".jobs-search-results__list-item",
-        "fields": [
-            {
-                "name": "title",
-                "selector": ".job-card-list__title",
-                "type": "text"
-            },
-            {
-                "name": "company",
-                "selector": ".job-card-container__company-name",
-                "type": "text"
-            },
-            {
-                "name": "location",
-                "selector": ".job-card-container__metadata-item",
-                "type": "text"
-            },
-            {
-                "name": "link",
-                "selector": ".job-card-list__title",
-                "type": "attribute",
-                "attribute": "href"
-            },
-            {
-                "name": "posted_time",
-                "selector": ".job-card-container__listed-time",
-                "type": "text"
-            }
-        ]
-    }
-
-    # Configure extraction strategy
-    extraction_strategy = JsonCssExtractionStrategy(schema, verbose=True)
-
-    # Configure crawler with improved scrolling and wait time
+# Contexts (or pages) that already carry the blocking route; weak so closed ones drop out
+_routed_targets = weakref.WeakSet()
+
+async def block_heavy_resources(page, context=None, **kwargs):
+    """Abort requests for binary assets and analytics before they hit the network"""
+    # The hook fires on every arun, and persistent profiles reuse the same context/page,
+    # so register the route once per context instead of stacking handlers
+    target = context if context is not None else page
+    if target in _routed_targets:
+        return page
+
+    async def handle_route(route):
+        request = route.request
+        host = urlparse(request.url).hostname or ""
+        if request.resource_type in BLOCKED_RESOURCE_TYPES or host.endswith(BLOCKED_HOSTS):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await target.route("**/*", handle_route)
+    _routed_targets.add(target)
+    return page
+
+class AsyncTokenBucket:
+    """Token bucket that paces requests proactively instead of backing off after a 429"""
+
+    def __init__(self, rate, burst):
+        self.rate = rate  # Tokens added per second
+        self.burst = burst
+        self.tokens = burst
+        self.ts = time.monotonic()
+        # Created on first acquire; on Python 3.9 a Lock made at import time binds to
+        # a different event loop than the one asyncio.run() starts
+        self.lock = None
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.ts) * self.rate)
+        self.ts = now
+
+    async def acquire(self, n=1):
+        if self.lock is None:
+            self.lock = asyncio.Lock()
+        async with self.lock:
+            self._refill()
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= n
+
+# Keep LinkedIn requests to one every 6 seconds, allowing short bursts of 3
+rate_limiter = AsyncTokenBucket(rate=1 / 6, burst=3)
+
+def json_loads(data):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj):
+    """Serialize to bytes (orjson's native output, and what Redis stores anyway)"""
+    return orjson.dumps(obj) if orjson else json.dumps(obj).encode()
+
+# Optional Redis cache of extracted jobs, enabled with LINKEDIN_SCRAPER_REDIS=1
+REDIS_ENABLED = os.environ.get("LINKEDIN_SCRAPER_REDIS") == "1"
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+REDIS_TTL = 600  # Seconds before a cached search is scraped again
+_redis_client = None
+
+def get_redis():
+    """Return a shared Redis client, or None when caching is disabled"""
+    global _redis_client, REDIS_ENABLED
+    if not REDIS_ENABLED:
+        return None
+    if _redis_client is None:
+        try:
+            import redis.asyncio as redis
+        except ImportError:
+            # Warn once and carry on without the cache
+            print("LINKEDIN_SCRAPER_REDIS=1 but the redis package is not installed; caching disabled")
+            REDIS_ENABLED = False
+            return None
+        _redis_client = redis.Redis.from_url(REDIS_URL)
+    return _redis_client
+
+async def close_redis():
+    """Close the shared Redis client so no connections are left open at loop shutdown"""
+    global _redis_client
+    if _redis_client is not None:
+        client, _redis_client = _redis_client, None
+        # redis-py 5 renamed close() to aclose()
+        await (client.aclose() if hasattr(client, "aclose") else client.close())
+
+def jobs_cache_key(search_query, location):
+    digest = hashlib.md5(f"{search_query}|{location}".encode()).hexdigest()
+    return f"ljs:{digest}"
+
+# Define the schema for job data extraction
+schema = {
+    "name": "LinkedIn Jobs",
+    "baseSelector": ".jobs-search-results__list-item",
+    "fields": [
+        {
+            "name": "title",
+            "selector": ".job-card-list__title",
+            "type": "text"
+        },
+        {
+            "name": "company",
+            "selector": ".job-card-container__company-name",
+            "type": "text"
+        },
+        {
+            "name": "location",
+            "selector": ".job-card-container__metadata-item",
+            "type": "text"
+        },
+        {
+            "name": "link",
+            "selector": ".job-card-list__title",
+            "type": "attribute",
+            "attribute": "href"
+        },
+        {
+            "name": "posted_time",
+            "selector": ".job-card-container__listed-time",
+            "type": "text"
+        }
+    ]
+}
+
+# Configure extraction strategy; the lxml strategy compiles each selector once and caches it
+extraction_strategy = JsonLxmlExtractionStrategy(schema, verbose=False)
+
+# LinkedIn's public jobs search page; keywords and location are filled in per search
+SEARCH_URL_TEMPLATE = (
+    "https://www.linkedin.com/jobs/search?keywords={keywords}&location={location}"
+    "&trk=public_jobs_jobs-search-bar_search-submit&position=1&pageNum=0"
+)
+
+async def scrape_linkedin_jobs(crawler, search_query, location=""):
+    """Yield job dicts for a search so callers can process them as they arrive"""
+    # Serve repeated searches from Redis instead of re-crawling
+    redis_client = get_redis()
+    cache_key = jobs_cache_key(search_query, location)
+    if redis_client is not None:
+        cached_jobs = None
+        try:
+            cached = await redis_client.get(cache_key)
+            if cached:
+                cached_jobs = json_loads(cached)
+                if not isinstance(cached_jobs, list):
+                    raise ValueError("cached value is not a list of jobs")
+        except Exception as e:
+            cached_jobs = None
+            print(f"Redis lookup failed: {str(e)}")
+            if isinstance(e, ValueError):  # Corrupt or foreign value; drop it and re-crawl
+                try:
+                    await redis_client.delete(cache_key)
+                except Exception:
+                    pass
+        if cached_jobs is not None:
+            for job in cached_jobs:
+                yield job
+            return
+
+    # Configure crawler with improved scrolling and wait time. Built per call because
+    # crawl4ai writes the target URL onto the config during arun.
     run_config = CrawlerRunConfig(
         extraction_strategy=extraction_strategy,
         cache_mode=CacheMode.BYPASS,
+        session_id=SCRAPE_SESSION_ID,
+        exclude_external_images=True,
         js_code=[
             """
-            (async () => {
-                const delay = ms => new Promise(r => setTimeout(r, ms));
-                
-                // Initial wait for page load
-                await delay(2000);
-                
-                // Scroll multiple times to load more content
-                let lastHeight = 0;
-                let unchangedCount = 0;
-                const MAX_UNCHANGED = 3;
-                
-                while (unchangedCount < MAX_UNCHANGED) {
+            // Wait for the first job card instead of waiting for the network to go idle
+            await new Promise(resolve => {
+                const deadline = Date.now() + 15000;
+                const check = () => document.querySelector('.jobs-search-results__list-item') || Date.now() > deadline
+                    ? resolve()
+                    : setTimeout(check, 100);
+                check();
+            });
+            """,
+            """
+            await (async () => {
+                const ITEM_SELECTOR = '.jobs-search-results__list-item';
+                const QUIET_MS = 800;       // Resolve once the list stops growing for this long
+                const HARD_CAP_MS = 20000;  // Never scroll for longer than this
+                const BUTTON_SELECTOR = 'button.infinite-scroller__show-more-button';
+                const ITEM_OR_BUTTON = `${ITEM_SELECTOR}, ${BUTTON_SELECTOR}`;
+
+                let observer;
+                // LinkedIn reuses one "Show more" button, so keep a reference instead of re-querying
+                let showMore = document.querySelector(BUTTON_SELECTOR);
+
+                const loadMore = () => {
                     window.scrollTo(0, document.body.scrollHeight);
-                    await delay(1500 + Math.random() * 1000);  // Randomized delay
-                    
-                    const newHeight = document.body.scrollHeight;
-                    if (newHeight === lastHeight) {
-                        unchangedCount++;
-                    } else {
-                        unchangedCount = 0;
-                    }
-                    lastHeight = newHeight;
-                    
-                    // Click "Show more" buttons if they exist
-                    const showMoreButtons = document.querySelectorAll('button.infinite-scroller__show-more-button');
-                    showMoreButtons.forEach(button => button.click());
-                }
-                
-                // Final wait for content to load
-                await delay(2000);
+                    if (showMore && showMore.isConnected) showMore.click();
+                };
+
+                // Resolve as soon as no new job cards arrive within one quiet window
+                const settled = new Promise(resolve => {
+                    let timer = setTimeout(resolve, QUIET_MS);
+                    observer = new MutationObserver(mutations => {
+                        let grew = false;
+                        let newButton = false;
+                        // Only inspect the added subtrees, with one query per added element
+                        for (const mutation of mutations) {
+                            for (const node of mutation.addedNodes) {
+                                if (node.nodeType !== Node.ELEMENT_NODE) continue;
+                                const matches = node.matches(ITEM_OR_BUTTON)
+                                    ? [node, ...node.querySelectorAll(ITEM_OR_BUTTON)]
+                                    : node.querySelectorAll(ITEM_OR_BUTTON);
+                                for (const el of matches) {
+                                    if (el.matches(BUTTON_SELECTOR)) {
+                                        showMore = el;
+                                        newButton = true;
+                                    } else {
+                                        grew = true;
+                                    }
+                                }
+                            }
+                        }
+                        // Unrelated DOM churn must not keep the scroll alive; only new cards re-arm the timer
+                        if (grew) {
+                            clearTimeout(timer);
+                            timer = setTimeout(resolve, QUIET_MS);
+                        }
+                        if (grew || newButton) loadMore();
+                    });
+                    observer.observe(document.body, { childList: true, subtree: true });
+                });
+
+                loadMore();
+                await Promise.race([settled, new Promise(r => setTimeout(r, HARD_CAP_MS))]);
+                observer.disconnect();
             })();
             """
         ],
-        delay_before_return_html=5000,  # Wait 5 seconds before extracting content
-        wait_until="networkidle",  # Wait for network requests to finish
-        page_timeout=30000,        # 30 second timeout
+        delay_before_return_html=0.5,  # Short settle time (seconds); scrolling is event-driven
+        wait_until="domcontentloaded",  # LinkedIn never goes network-idle; wait for job cards instead
+        page_timeout=30000,        # 30 second safety net
         ignore_body_visibility=True,
         simulate_user=True,        # Help avoid detection
         override_navigator=True    # Help avoid detection
     )
 
-    # Format search URL (using LinkedIn's public jobs page)
-    search_query = search_query.replace(' ', '%20')
-    location = location.replace(' ', '%20')
-    url = f"https://www.linkedin.com/jobs/search?keywords={search_query}&location={location}&trk=public_jobs_jobs-search-bar_search-submit&position=1&pageNum=0"
+    # Format search URL, encoding '&', '+', '/' and non-ASCII characters as well as spaces
+    url = SEARCH_URL_TEMPLATE.format(keywords=quote_plus(search_query), location=quote_plus(location))
 
     try:
-        async with AsyncWebCrawler(config=browser_config) as crawler:
-            result = await crawler.arun(url=url, config=run_config)
+        await rate_limiter.acquire()
+        result = await crawler.arun(url=url, config=run_config)
 
-            try:
-                # Parse and format results
-                jobs = json.loads(result.extracted_content)
-                return jobs
-            except json.JSONDecodeError:
-                print("No jobs found or error parsing results")
-                return []
+        try:
+            # Parse and format results
+            jobs = json_loads(result.extracted_content)
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+            print("No jobs found or error parsing results")
+            return
+        # Drop the page HTML/markdown before handing jobs to the caller
+        del result
 
     except Exception as e:
         print(f"Error occurred: {str(e)}")
-        return []
+        return
+
+    if jobs and redis_client is not None:
+        try:
+            await redis_client.setex(cache_key, REDIS_TTL, json_dumps(jobs))
+        except Exception as e:
+            print(f"Redis write failed: {str(e)}")
+
+    for job in jobs:
+        yield job
+
+async def scrape_many(crawler, queries):
+    """Scrape several (search_query, location) pairs one after another, yielding (query, job)"""
+    # Every scrape drives the same persistent-profile tab, so searches must not overlap
+    for search_query, location in queries:
+        async for job in scrape_linkedin_jobs(crawler, search_query, location):
+            yield (search_query, location), job
+
+async def start_scrape_crawler():
+    """Start the headless scrape browser with heavy resources blocked"""
+    crawler = AsyncWebCrawler(config=scrape_browser_config)
+    await crawler.start()
+    # Only intercept requests while scraping so the login page renders normally
+    crawler.crawler_strategy.set_hook("on_page_context_created", block_heavy_resources)
+    return crawler
+
+async def is_logged_in(crawler):
+    """Check whether the saved profile still holds an authenticated LinkedIn session"""
+    probe_config = CrawlerRunConfig(
+        cache_mode=CacheMode.BYPASS,
+        session_id=SCRAPE_SESSION_ID,
+        js_code=["""
+            // Give the navigation bar up to 5 seconds to render
+            await new Promise(resolve => {
+                const deadline = Date.now() + 5000;
+                const check = () => document.querySelector('.global-nav__me') || Date.now() > deadline
+                    ? resolve()
+                    : setTimeout(check, 100);
+                check();
+            });
+        """],
+        wait_until="domcontentloaded",
+        page_timeout=15000,
+        ignore_body_visibility=True
+    )
+
+    try:
+        await rate_limiter.acquire()
+        result = await crawler.arun(url="https://www.linkedin.com/feed/", config=probe_config)
+    except Exception as e:
+        print(f"Error checking login status: {str(e)}")
+        return False
 
-async def login_to_linkedin():
+    # Logged-out visits to /feed/ land on the sign-in page, which has no profile menu
+    return bool(result.success and result.status_code == 200 and "global-nav__me" in (result.html or ""))
+
+async def login_to_linkedin(crawler):
     """Handle the LinkedIn login process"""
     print("\nStarting LinkedIn Login Process")
     print("===============================")
@@ -138,7 +415,8 @@ async def login_to_linkedin():
     
     # Create a proper CrawlerRunConfig for login
     login_config = CrawlerRunConfig(
-        delay_before_return_html=15000,  # Longer delay for login
+        delay_before_return_html=0.5,  # The Enter prompt below already waits for the user (seconds)
+        session_id=LOGIN_SESSION_ID,   # Keep the tab open after arun returns
         js_code=["""
             (async () => {
                 const delay = ms => new Promise(r => setTimeout(r, ms));
@@ -166,66 +444,156 @@ async def login_to_linkedin():
             })();
         """],
         cache_mode=CacheMode.BYPASS,  # Important: bypass cache for login
-        wait_until="networkidle",     # Wait for network to be idle
+        wait_until="domcontentloaded",  # LinkedIn never goes network-idle
         page_timeout=60000,           # Increase timeout for login
-        ignore_body_visibility=True    # Don't wait for body visibility
+        ignore_body_visibility=True,   # Don't wait for body visibility
+        exclude_external_images=True
     )
 
     try:
-        # Initialize the crawler with both configs
-        crawler = AsyncWebCrawler(config=browser_config)
-        async with crawler as browser:
-            print("2. Navigating to LinkedIn...")
-            # Pass the login_config to arun
-            result = await browser.arun(
-                url="https://www.linkedin.com",
-                config=login_config  # Pass the config here
-            )
-            print("3. Browser navigation complete")
-            print("4. Please log in to LinkedIn in the opened browser")
-            print("5. After logging in, the script will save your session")
-            input("\nPress Enter once you have logged in to continue...")
-            return True
-            
+        print("2. Navigating to LinkedIn...")
+        # Pass the login_config to arun
+        result = await crawler.arun(
+            url="https://www.linkedin.com",
+            config=login_config  # Pass the config here
+        )
+        print("3. Browser navigation complete")
+        print("4. Please log in to LinkedIn in the opened browser")
+        print("5. After logging in, the script will save your session")
+        input("\nPress Enter once you have logged in to continue...")
+        return True
+
     except Exception as e:
         print(f"Error during login process: {str(e)}")
         return False
+    finally:
+        await crawler.crawler_strategy.kill_session(LOGIN_SESSION_ID)
+
+async def open_scrape_session():
+    """Return a started headless crawler on a logged-in profile, or None if login fails"""
+    created = ensure_profile_dir()
+
+    # Reuse the saved session when it is still valid and only fall back to the
+    # interactive login when it has expired. A fresh profile without cookies cannot
+    # be logged in, so skip the probe browser and go straight to login.
+    crawler = None
+    if not created and profile_has_cookies():
+        crawler = await start_scrape_crawler()
+        if not await is_logged_in(crawler):
+            # Chromium locks the profile directory, so release it for the login browser
+            await crawler.close()
+            crawler = None
+
+    if crawler is None:
+        async with AsyncWebCrawler(config=login_browser_config) as login_crawler:
+            logged_in = await login_to_linkedin(login_crawler)
+        if not logged_in:
+            print("Failed to complete login process")
+            return None
+        crawler = await start_scrape_crawler()
+    return crawler
 
-async def main():
+async def scrape_queries(queries):
+    """Scrape many (search_query, location) pairs in a single browser session, yielding (query, job)"""
+    crawler = await open_scrape_session()
+    if crawler is None:
+        return
+
+    queries = [tuple(query) for query in queries]
+    try:
+        async for query, job in scrape_many(crawler, queries):
+            yield query, job
+    finally:
+        await crawler.close()
+        await close_redis()
+
+def load_queries(path):
+    """Load and validate a JSON list of [search_query, location] string pairs"""
+    with open(path) as f:
+        queries = json.load(f)  # json.JSONDecodeError is a ValueError
+
+    if not isinstance(queries, list):
+        raise ValueError("expected a JSON list of [search_query, location] pairs")
+
+    bad_entries = [
+        f"entry {index}: {query!r}"
+        for index, query in enumerate(queries)
+        if not (isinstance(query, list) and len(query) == 2 and all(isinstance(part, str) for part in query))
+    ]
+    if bad_entries:
+        raise ValueError(
+            "each entry must be a [search_query, location] pair of strings "
+            "(use \"\" for any location); bad " + ", ".join(bad_entries)
+        )
+    return [tuple(query) for query in queries]
+
+async def main(queries_file=None, output_file="jobs.jsonl"):
     print("\nLinkedIn Jobs Scraper")
     print("====================")
-    
-    # First handle login
-    if not await login_to_linkedin():
-        print("Failed to complete login process")
+
+    if queries_file:
+        # Batch mode: a JSON list of [search_query, location] pairs
+        try:
+            queries = load_queries(queries_file)
+        except (OSError, ValueError) as e:
+            print(f"Invalid queries file {queries_file}: {str(e)}")
+            return
+
+        print(f"\nStarting Job Search for {len(queries)} queries")
+        print("==================")
+
+        # Write each job as soon as it is scraped, one JSON object per line, appended so
+        # repeated runs accumulate
+        job_counts = dict.fromkeys(queries, 0)
+        results = scrape_queries(queries)
+        try:
+            async with aiofiles.open(output_file, "ab") as out:
+                async for query, job in results:
+                    job_counts[query] += 1
+                    await out.write(json_dumps(job) + b"\n")
+        finally:
+            # Close the browser even if writing fails part-way
+            await results.aclose()
+
+        for (search_query, location), count in job_counts.items():
+            print(f"{search_query} in {location or 'any location'}: {count} jobs")
+        print(f"\nWrote {sum(job_counts.values())} jobs to {output_file}")
+        return
+
+    crawler = await open_scrape_session()
+    if crawler is None:
         return
 
     print("\nStarting Job Search")
     print("==================")
     print("1. Searching for Python developer jobs in United States...")
-    
+
+    # Write results as they are yielded, one JSON object per line
+    job_count = 0
     try:
-        jobs = await scrape_linkedin_jobs("python developer", "United States")
+        async with aiofiles.open(output_file, "ab") as out:
+            async for job in scrape_linkedin_jobs(crawler, "python developer", "United States"):
+                job_count += 1
+                await out.write(json_dumps(job) + b"\n")
     except Exception as e:
         print(f"Error during job search: {str(e)}")
         return
-    
-    if not jobs:
+    finally:
+        await crawler.close()
+        await close_redis()
+
+    if not job_count:
         print("\nNo jobs were found. This could be due to:")
         print("1. Not logged in to LinkedIn (please run again and log in)")
         print("2. No matching jobs in the specified location")
         print("3. Network connectivity issues")
         return
-    
-    # Print results
-    print(f"\nFound {len(jobs)} jobs:")
-    for job in jobs:
-        print("\n---")
-        print(f"Title: {job['title']}")
-        print(f"Company: {job['company']}")
-        print(f"Location: {job['location']}")
-        print(f"Posted: {job['posted_time']}")
-        print(f"Link: {job['link']}")
+
+    print(f"\nFound {job_count} jobs, written to {output_file}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Scrape LinkedIn job listings")
+    parser.add_argument("--queries", help="JSON file with a list of [search_query, location] pairs")
+    parser.add_argument("--output", default="jobs.jsonl", help="JSONL file the jobs are appended to")
+    args = parser.parse_args()
+    asyncio.run(main(args.queries, args.output))